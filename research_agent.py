@@ -8,22 +8,99 @@ An intelligent agent that autonomously researches topics by:
 """
 
 import asyncio
+import copy
+import functools
+import hashlib
 import json
-from datetime import datetime
-from typing import Any, Optional
-from dataclasses import dataclass, field
-from enum import Enum
+import math
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, time as dt_time
+from typing import Any, AsyncIterator, Optional
+from dataclasses import asdict, dataclass, field, is_dataclass
+from enum import IntEnum
 import re
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the stdlib json
+    orjson = None
 
-class ResearchState(Enum):
-    IDLE = "idle"
-    SEARCHING = "searching"
-    EXTRACTING = "extracting"
-    ANALYZING = "analyzing"
-    SYNTHESIZING = "synthesizing"
-    COMPLETE = "complete"
-    ERROR = "error"
+try:
+    import httpx
+except ImportError:  # Optional, only needed with fetch_pages=True
+    httpx = None
+
+try:
+    import h2  # noqa: F401
+except ImportError:  # Optional, enables HTTP/2 for fetch_pages
+    h2 = None
+
+
+# Bulleted ("- ", "• ", "* ") or numbered ("1. ") list items
+_BULLET_RE = re.compile(r'[ \t]*(?:[-•*]|\d+\.)[ \t]+(.*\S)')
+_WORD_RE = re.compile(r'\w+')
+
+# Demo-mode page content, parsed once at import
+_MOCK_CONTENT = """\
+Research findings about {topic}:
+
+Key Information:
+- Overview: This is a comprehensive source about {topic}
+- The topic covers several important aspects
+- There are multiple perspectives on this subject
+
+Main Points:
+1. First key point about {topic}
+2. Second important aspect to consider
+3. Third notable finding from research
+
+Conclusion:
+Based on the analysis, {topic} is significant because it impacts
+various areas including technology, business, and society."""
+
+# Kept constant so its tokens hash identically across calls (prefix cache hits)
+SYNTHESIS_PROMPT = (
+    "You are a research assistant. Summarize the research on the topic below "
+    "based on the findings that follow. Be concise and factual."
+)
+
+
+class ResearchState(IntEnum):
+    IDLE = 0
+    SEARCHING = 1
+    EXTRACTING = 2
+    ANALYZING = 3
+    SYNTHESIZING = 4
+    COMPLETE = 5
+    ERROR = 6
+
+
+# Display names indexed by ResearchState
+_STATE_NAMES = tuple(state.name.lower() for state in ResearchState)
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Stdlib fallback for the types we serialize that orjson handles natively
+    (dataclasses and datetimes); anything else raises TypeError like orjson.
+    """
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if isinstance(obj, (datetime, date, dt_time)):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        obj, default=_json_default, separators=(",", ":"), ensure_ascii=False
+    ).encode()
 
 
 @dataclass
@@ -55,6 +132,52 @@ class ResearchReport:
     sources: list[Source] = field(default_factory=list)
     key_insights: list[str] = field(default_factory=list)
     created_at: str = ""
+    
+    def to_json(self) -> bytes:
+        """Serialize the report to JSON bytes"""
+        return _dumps(self)
+
+
+def _report_from_dict(data: dict) -> ResearchReport:
+    """Rebuild a ResearchReport and its findings/sources from asdict() output"""
+    return ResearchReport(**{
+        **data,
+        "findings": [Finding(**f) for f in data.get("findings", [])],
+        "sources": [Source(**s) for s in data.get("sources", [])]
+    })
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    """Cosine similarity between two vectors"""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+def _normalize_topic(topic: str) -> str:
+    """Lowercase a topic and collapse its whitespace"""
+    return " ".join(topic.lower().split())
+
+
+@functools.lru_cache(maxsize=1024)
+def _queries_for(base_topic: str, max_queries: int) -> tuple[str, ...]:
+    """Related search queries for a normalized topic (memoized)"""
+    
+    queries = [
+        base_topic,
+        f"what is {base_topic}",
+        f"{base_topic} guide",
+        f"best practices {base_topic}",
+        f"{base_topic} tutorial"
+    ]
+    
+    # Deduplicate while preserving order
+    return tuple(dict.fromkeys(queries))[:max_queries]
+
+
+def _store_key(key: tuple[str, str]) -> str:
+    """Stable hash of a (depth, topic) cache key for the on-disk store"""
+    return hashlib.blake2b(f"{key[0]}|{key[1]}".encode(), digest_size=16).hexdigest()
 
 
 class AgenticResearcher:
@@ -65,14 +188,67 @@ class AgenticResearcher:
     - Synthesizes findings into reports
     """
     
-    def __init__(self, scraper_agent=None, llm_provider=None):
+    def __init__(
+        self,
+        scraper_agent=None,
+        llm_provider=None,
+        embedder=None,
+        cache_ttl: float = 3600.0,
+        similarity_threshold: float = 0.92,
+        cache_path: Optional[str] = None,
+        fetch_pages: bool = False,
+    ):
+        """
+        Args:
+            scraper_agent: Optional scraper used to find and fetch sources
+            llm_provider: Optional LLM with an async generate(prompt) -> str
+                method. Providers that can mark a cacheable prompt prefix
+                (e.g. Anthropic cache_control, DeepSeek prefix caching) may
+                set supports_prompt_caching = True; generate() is then called
+                as generate(prompt, cache_prefix=prefix), where prefix is the
+                stable leading part of prompt.
+            embedder: Optional callable text -> list[float] that enables
+                near-duplicate topic matching in the report cache
+            cache_ttl: Seconds a cached report stays valid
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            cache_path: Optional SQLite file that persists the report cache
+            fetch_pages: Fetch source URLs over HTTP (requires httpx)
+        """
         self.scraper = scraper_agent
         self.llm = llm_provider
+        self.embedder = embedder  # Optional callable: text -> list[float]
         self.state = ResearchState.IDLE
         self.findings: list[Finding] = []
         self.sources: list[Source] = []
         self.action_history = []
         
+        # Wall-clock anchor for rendering monotonic action timestamps
+        self._wall_base = time.time()
+        self._mono_base = time.monotonic_ns()
+        
+        # Report cache keyed by (depth, normalized topic)
+        self.cache_ttl = cache_ttl
+        self.similarity_threshold = similarity_threshold
+        self._cache: dict[tuple[str, str], tuple[float, ResearchReport]] = {}
+        self._cache_vectors: dict[tuple[str, str], list[float]] = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
+        
+        # Shared HTTP client for live fetching, created on first use
+        if fetch_pages and httpx is None:
+            raise ImportError(
+                "fetch_pages=True requires httpx: pip install 'httpx[http2]'"
+            )
+        self.fetch_pages = fetch_pages
+        self._http = None
+        
+        # Optional SQLite store so cached reports survive restarts. Queries run
+        # in worker threads (see _cache_get/_cache_put), serialized by the lock
+        self._store: Optional[sqlite3.Connection] = None
+        self._store_lock = threading.Lock()
+        if cache_path:
+            self._open_store(cache_path)
+        
     async def research(self, topic: str, depth: str = "medium") -> ResearchReport:
         """
         Research a topic and generate a comprehensive report.
@@ -84,32 +260,55 @@ class AgenticResearcher:
         Returns:
             ResearchReport with findings and sources
         """
-        self.state = ResearchState.SEARCHING
-        self.log_action("research_started", {"topic": topic, "depth": depth})
+        key = (depth, _normalize_topic(topic))
+        
+        # Findings and sources are per-run scratch; earlier reports keep theirs.
+        # Helpers get the lists passed in, self.* just mirrors them for get_status()
+        findings: list[Finding] = []
+        self.findings = findings
+        self.sources = []
         
-        # Determine number of sources based on depth
+        # Determine number of sources and concurrency based on depth
         num_sources = {"shallow": 3, "medium": 5, "deep": 10}.get(depth, 5)
+        max_concurrency = {"shallow": 3, "medium": 5, "deep": 8}.get(depth, 5)
         
         try:
+            cached, vector = await self._cache_get(key)
+            if cached is not None:
+                self.findings = cached.findings
+                self.sources = cached.sources
+                self.state = ResearchState.COMPLETE
+                self.log_action("cache_hit", {"topic": topic, "depth": depth})
+                return cached
+            
+            self.state = ResearchState.SEARCHING
+            self.log_action("research_started", {"topic": topic, "depth": depth})
+            
             # Step 1: Search for relevant sources
-            sources = await self._find_sources(topic, num_sources)
-            self.sources = sources
+            sources = self.sources = await self._find_sources(topic, num_sources)
             
             # Step 2: Extract content from sources
             self.state = ResearchState.EXTRACTING
-            await self._extract_from_sources(topic, sources)
+            await self._extract_from_sources(topic, sources, findings, max_concurrency)
             
             # Step 3: Analyze findings
             self.state = ResearchState.ANALYZING
-            await self._analyze_findings(topic)
+            await self._analyze_findings(topic, findings)
             
             # Step 4: Synthesize into report
             self.state = ResearchState.SYNTHESIZING
-            report = await self._synthesize_report(topic)
+            report = await self._synthesize_report(topic, findings, sources)
             
             self.state = ResearchState.COMPLETE
-            self.log_action("research_complete", {"findings": len(self.findings)})
+            self.log_action("research_complete", {"findings": len(findings)})
             
+            # Don't let a run where every extraction failed stick for the TTL
+            if findings:
+                try:
+                    await self._cache_put(key, report, vector)
+                except Exception as e:
+                    # A caching problem must not cost us a finished report
+                    self.log_action("cache_put_failed", {"error": str(e)})
             return report
             
         except Exception as e:
@@ -122,8 +321,9 @@ class AgenticResearcher:
     async def _find_sources(self, topic: str, num_sources: int) -> list[Source]:
         """Find relevant sources for the topic"""
         
-        # Generate search queries based on topic
-        queries = self._generate_search_queries(topic)
+        # Each query yields 2 sources, so only generate the ones we'll use
+        max_queries = (num_sources + 1) // 2
+        queries = self._generate_search_queries(topic, max_queries)
         
         sources = []
         
@@ -132,6 +332,7 @@ class AgenticResearcher:
                 break
                 
             self.log_action("searching", {"query": query})
+            now = datetime.now().isoformat()
             
             # Use scraper to find sources (in demo mode, generate mock)
             if self.scraper:
@@ -144,13 +345,13 @@ class AgenticResearcher:
                     url=f"https://example.com/{query.replace(' ', '-')}/1",
                     title=f"Article about {query} - Source 1",
                     relevance=0.9,
-                    extracted_at=datetime.now().isoformat()
+                    extracted_at=now
                 ),
                 Source(
                     url=f"https://example.com/{query.replace(' ', '-')}/2",
                     title=f"Guide to {query}",
                     relevance=0.8,
-                    extracted_at=datetime.now().isoformat()
+                    extracted_at=now
                 )
             ]
             
@@ -158,65 +359,87 @@ class AgenticResearcher:
         
         return sources[:num_sources]
     
-    async def _extract_from_sources(self, topic: str, sources: list[Source]):
-        """Extract relevant content from sources"""
+    async def _extract_from_sources(
+        self,
+        topic: str,
+        sources: list[Source],
+        findings: list[Finding],
+        max_concurrency: int = 5,
+    ):
+        """Extract relevant content from sources concurrently"""
+        
+        sem = asyncio.Semaphore(max_concurrency)
+        
+        async def _one(source: Source) -> Finding:
+            async with sem:
+                self.log_action("extracting", {"url": source.url})
+                
+                # Stream content and key points in one pass (demo mode uses mock)
+                lines = self._iter_content(source.url, topic)
+                try:
+                    content, key_points = await self._extract_content_and_points(lines)
+                finally:
+                    await lines.aclose()  # Release the response if we stopped early
+                source.content = content
+                
+                return Finding(
+                    topic=topic,
+                    content=content,
+                    source=source.url,
+                    key_points=key_points
+                )
         
-        for source in sources:
-            self.log_action("extracting", {"url": source.url})
-            
-            # Extract content (demo mode uses mock)
-            content = await self._extract_content(source.url, topic)
-            source.content = content
-            
-            # Extract key points
-            finding = Finding(
-                topic=topic,
-                content=content[:500],  # First 500 chars
-                source=source.url,
-                key_points=self._extract_key_points(content)
-            )
-            
-            self.findings.append(finding)
+        results = await asyncio.gather(
+            *(_one(source) for source in sources), return_exceptions=True
+        )
+        
+        # A failing source shouldn't sink the whole run
+        for source, result in zip(sources, results):
+            if isinstance(result, BaseException):
+                self.log_action("extract_failed", {"url": source.url, "error": str(result)})
+            else:
+                findings.append(result)
     
-    async def _extract_content(self, url: str, topic: str) -> str:
-        """Extract content from a URL"""
+    async def _iter_content(self, url: str, topic: str) -> AsyncIterator[str]:
+        """Stream the content of a URL line by line"""
         
-        # In demo mode, generate relevant mock content
-        mock_content = f"""
-        Research findings about {topic}:
-        
-        Key Information:
-        - Overview: This is a comprehensive source about {topic}
-        - The topic covers several important aspects
-        - There are multiple perspectives on this subject
-        
-        Main Points:
-        1. First key point about {topic}
-        2. Second important aspect to consider
-        3. Third notable finding from research
-        
-        Conclusion:
-        Based on the analysis, {topic} is significant because it impacts
-        various areas including technology, business, and society.
-        """
+        if self.fetch_pages and not self.scraper:
+            async with self._get_http().stream("GET", url) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    yield line
+            return
         
-        return mock_content.strip()
+        # In demo mode, generate relevant mock content
+        for line in _MOCK_CONTENT.format_map({"topic": topic}).split('\n'):
+            yield line
     
-    def _extract_key_points(self, content: str) -> list[str]:
-        """Extract key points from content"""
+    async def _extract_content_and_points(
+        self, lines: AsyncIterator[str], max_chars: int = 500, max_points: int = 5
+    ) -> tuple[str, list[str]]:
+        """Collect the first max_chars of content and up to max_points key points"""
         
-        # Simple extraction: look for bullet points and numbered items
+        head = []
+        size = 0
         points = []
         
-        lines = content.split('\n')
-        for line in lines:
-            line = line.strip()
-            if line.startswith(('- ', '• ', '* ', '1.', '2.', '3.')):
-                points.append(line.lstrip('-•*123. '))
+        async for line in lines:
+            if size < max_chars:
+                head.append(line)
+                size += len(line) + 1
+            
+            if len(points) < max_points:
+                m = _BULLET_RE.match(line)
+                if m:
+                    points.append(m.group(1).strip())
+            
+            # Stop reading once both are satisfied
+            if size >= max_chars and len(points) >= max_points:
+                break
         
-        return points[:5]  # Limit to 5 key points
+        return '\n'.join(head)[:max_chars], points
     
-    async def _analyze_findings(self, topic: str):
+    async def _analyze_findings(self, topic: str, findings: list[Finding]):
         """Analyze and categorize findings"""
         
         # Use LLM if available for deeper analysis
@@ -224,47 +447,53 @@ class AgenticResearcher:
             # Deep analysis would go here
             pass
         
-        # Calculate relevance scores
-        for finding in self.findings:
-            # Simple keyword-based relevance
-            topic_words = topic.lower().split()
-            content_lower = finding.content.lower()
-            
-            matches = sum(1 for word in topic_words if word in content_lower)
-            finding.confidence = min(matches / len(topic_words), 1.0)
+        # Calculate relevance scores (simple keyword overlap)
+        topic_set = set(_WORD_RE.findall(topic.lower()))
+        num_words = len(topic_set) or 1
+        content_sets = [set(_WORD_RE.findall(f.content.lower())) for f in findings]
+        
+        for finding, content_set in zip(findings, content_sets):
+            finding.confidence = min(len(topic_set & content_set) / num_words, 1.0)
         
         # Sort by confidence
-        self.findings.sort(key=lambda f: f.confidence, reverse=True)
+        findings.sort(key=lambda f: f.confidence, reverse=True)
     
-    async def _synthesize_report(self, topic: str) -> ResearchReport:
+    async def _synthesize_report(
+        self, topic: str, findings: list[Finding], sources: list[Source]
+    ) -> ResearchReport:
         """Synthesize all findings into a comprehensive report"""
         
         # Generate summary
         if self.llm:
-            summary = await self.llm.generate(
-                f"Summarize research on {topic} based on these findings:\n"
-                + "\n".join(f.content for f in self.findings[:5])
-            )
+            # Stable prefix first, variable findings last
+            prefix = f"{SYNTHESIS_PROMPT}\nTopic: {topic}\n---\nFindings:\n"
+            body = "\n".join(f.content for f in findings[:5])
+            if getattr(self.llm, "supports_prompt_caching", False):
+                summary = await self.llm.generate(prefix + body, cache_prefix=prefix)
+            else:
+                summary = await self.llm.generate(prefix + body)
         else:
-            summary = self._generate_summary(topic)
+            summary = self._generate_summary(topic, findings, sources)
         
         # Extract key insights
-        insights = self._generate_insights()
+        insights = self._generate_insights(findings)
         
         return ResearchReport(
             topic=topic,
             summary=summary,
-            findings=self.findings,
-            sources=self.sources,
+            findings=findings,
+            sources=sources,
             key_insights=insights,
             created_at=datetime.now().isoformat()
         )
     
-    def _generate_summary(self, topic: str) -> str:
+    def _generate_summary(
+        self, topic: str, findings: list[Finding], sources: list[Source]
+    ) -> str:
         """Generate a summary of the research"""
         
-        num_findings = len(self.findings)
-        num_sources = len(self.sources)
+        num_findings = len(findings)
+        num_sources = len(sources)
         
         return f"""
         Research on '{topic}' completed successfully.
@@ -276,76 +505,288 @@ class AgenticResearcher:
         See key insights below for the most important takeaways.
         """.strip()
     
-    def _generate_insights(self) -> list[str]:
+    def _generate_insights(self, findings: list[Finding]) -> list[str]:
         """Generate key insights from findings"""
         
+        # Collect unique key points in a single pass, stopping at 5
+        seen = set()
         insights = []
         
-        # Collect unique key points
-        all_points = []
-        for finding in self.findings:
-            all_points.extend(finding.key_points)
-        
-        # Deduplicate and limit
-        seen = set()
-        for point in all_points:
-            if point not in seen and len(insights) < 5:
-                insights.append(point)
+        for finding in findings:
+            for point in finding.key_points:
+                if point in seen:
+                    continue
                 seen.add(point)
+                insights.append(point)
+                if len(insights) == 5:
+                    return insights
         
         return insights
     
-    def _generate_search_queries(self, topic: str) -> list[str]:
+    def _generate_search_queries(self, topic: str, max_queries: int = 5) -> tuple[str, ...]:
         """Generate search queries from a topic"""
-        
-        # Generate related queries
-        base_topic = topic.lower()
-        
-        queries = [
-            base_topic,
-            f"what is {base_topic}",
-            f"{base_topic} guide",
-            f"best practices {base_topic}",
-            f"{base_topic} tutorial"
-        ]
-        
-        return queries
+        return _queries_for(_normalize_topic(topic), max_queries)
     
     def log_action(self, action: str, params: dict):
         """Log an action"""
         self.action_history.append({
             "action": action,
             "params": params,
-            "timestamp": datetime.now().isoformat(),
-            "state": self.state.value
+            "ts_ns": time.monotonic_ns(),  # Formatted lazily, see formatted_history()
+            "state": _STATE_NAMES[self.state]
         })
     
+    def history_json(self) -> bytes:
+        """Serialize the formatted action history to JSON bytes"""
+        return _dumps(self.formatted_history())
+    
+    def _ns_to_iso(self, ts_ns: int) -> str:
+        """Convert a monotonic_ns timestamp to an ISO wall-clock string"""
+        return datetime.fromtimestamp(
+            self._wall_base + (ts_ns - self._mono_base) / 1e9
+        ).isoformat()
+    
+    def formatted_history(self) -> list[dict]:
+        """Get the action history with ISO-formatted timestamps"""
+        return [
+            {
+                "action": entry["action"],
+                "params": entry["params"],
+                "timestamp": self._ns_to_iso(entry["ts_ns"]),
+                "state": entry["state"]
+            }
+            for entry in self.action_history
+        ]
+    
+    def _open_store(self, path: str):
+        """Open the on-disk report cache and load its live entries"""
+        
+        path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        
+        self._store = sqlite3.connect(path, check_same_thread=False)
+        self._store.execute(
+            "CREATE TABLE IF NOT EXISTS reports ("
+            "key TEXT PRIMARY KEY, depth TEXT, topic TEXT, "
+            "stored_at REAL, vector TEXT, report BLOB)"
+        )
+        self._store.execute(
+            "DELETE FROM reports WHERE stored_at < ?", (time.time() - self.cache_ttl,)
+        )
+        
+        rows = self._store.execute(
+            "SELECT key, depth, topic, stored_at, vector, report FROM reports"
+        ).fetchall()
+        for row_key, depth, topic, stored_at, vector, blob in rows:
+            if self._remember((depth, topic), stored_at, blob, vector) is None:
+                self._store.execute("DELETE FROM reports WHERE key = ?", (row_key,))
+        
+        self._store.commit()
+    
+    def _fetch_row(self, key: tuple[str, str]) -> Optional[tuple]:
+        """Read one store row (runs in a worker thread)"""
+        with self._store_lock:
+            return self._store.execute(
+                "SELECT stored_at, vector, report FROM reports WHERE key = ?",
+                (_store_key(key),)
+            ).fetchone()
+    
+    def _write_row(self, key: tuple[str, str], stored_at: float, vector, report: ResearchReport):
+        """Write one store row (runs in a worker thread)"""
+        row = (
+            _store_key(key), key[0], key[1], stored_at,
+            json.dumps(vector) if vector is not None else None,
+            _dumps(report)
+        )
+        with self._store_lock:
+            self._store.execute("INSERT OR REPLACE INTO reports VALUES (?, ?, ?, ?, ?, ?)", row)
+            self._store.commit()
+    
+    def _delete_row(self, key: tuple[str, str]):
+        """Delete one store row (runs in a worker thread)"""
+        with self._store_lock:
+            self._store.execute("DELETE FROM reports WHERE key = ?", (_store_key(key),))
+            self._store.commit()
+    
+    async def _load_entry(self, key: tuple[str, str]) -> Optional[tuple[float, ResearchReport]]:
+        """Fetch an entry another process may have written to the store"""
+        
+        try:
+            row = await asyncio.to_thread(self._fetch_row, key)
+            if row is None or time.time() - row[0] > self.cache_ttl:
+                return None
+            
+            entry = self._remember(key, row[0], row[2], row[1])
+            if entry is None:
+                await asyncio.to_thread(self._delete_row, key)
+            return entry
+        
+        except sqlite3.Error as e:
+            # e.g. locked by another process; treat as a miss
+            self.log_action("cache_store_failed", {"op": "read", "error": str(e)})
+            return None
+    
+    def _remember(
+        self, key: tuple[str, str], stored_at: float, blob: bytes, vector: Optional[str]
+    ) -> Optional[tuple[float, ResearchReport]]:
+        """Decode a persisted entry into the in-memory cache, None if it is unreadable"""
+        
+        try:
+            report = _report_from_dict(json.loads(blob))
+            vector = json.loads(vector) if vector is not None else None
+        except (ValueError, TypeError, AttributeError):
+            return None
+        
+        self._cache[key] = (stored_at, report)
+        if vector is not None:
+            self._cache_vectors[key] = vector
+        return self._cache[key]
+    
+    def _embed(self, text: str) -> list[float]:
+        """Embed text as plain floats (e.g. numpy float32 isn't JSON-serializable)"""
+        return [float(x) for x in self.embedder(text)]
+    
+    async def _cache_get(
+        self, key: tuple[str, str]
+    ) -> tuple[Optional[ResearchReport], Optional[list[float]]]:
+        """
+        Look up a cached report by exact key, then by embedding similarity.
+        
+        Returns the report (or None on a miss) and the topic embedding if one
+        was computed, so a later _cache_put doesn't embed the topic again.
+        """
+        
+        now = time.time()
+        
+        # Drop expired entries
+        for k in [k for k, (t, _) in self._cache.items() if now - t > self.cache_ttl]:
+            del self._cache[k]
+            self._cache_vectors.pop(k, None)
+        
+        entry = self._cache.get(key)
+        vector = None
+        
+        if entry is None and self._store is not None:
+            entry = await self._load_entry(key)
+        
+        if entry is None and self.embedder and self._cache_vectors:
+            vector = self._embed(key[1])
+            best_key, best_score = None, self.similarity_threshold
+            for k, v in self._cache_vectors.items():
+                if k[0] != key[0]:
+                    continue
+                score = _cosine(vector, v)
+                if score >= best_score:
+                    best_key, best_score = k, score
+            if best_key is not None:
+                entry = self._cache[best_key]
+        
+        if entry is None:
+            self._cache_misses += 1
+            return None, vector
+        
+        self._cache_hits += 1
+        report = copy.deepcopy(entry[1])
+        report.created_at = datetime.now().isoformat()
+        return report, vector
+    
+    async def _cache_put(
+        self, key: tuple[str, str], report: ResearchReport, vector: Optional[list[float]] = None
+    ):
+        """Store a completed report in the cache"""
+        
+        now = time.time()
+        self._cache[key] = (now, copy.deepcopy(report))
+        if self.embedder:
+            if vector is None:
+                vector = self._embed(key[1])
+            self._cache_vectors[key] = vector
+        
+        if self._store is not None:
+            try:
+                await asyncio.to_thread(self._write_row, key, now, vector, self._cache[key][1])
+            except sqlite3.Error as e:
+                # Keep the in-memory entry, it just won't be persisted
+                self.log_action("cache_store_failed", {"op": "write", "error": str(e)})
+    
+    def cache_stats(self) -> dict:
+        """Get report cache statistics"""
+        return {
+            "size": len(self._cache),
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "ttl": self.cache_ttl,
+            "semantic": self.embedder is not None,
+            "persistent": self._store is not None
+        }
+    
+    def _get_http(self):
+        """Get the pooled HTTP client shared by all extractions"""
+        
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                http2=h2 is not None,
+                timeout=10.0,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+            )
+        
+        return self._http
+    
+    async def aclose(self):
+        """Close the shared HTTP client and the cache store"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        await self.aclose()
+    
     def get_status(self) -> dict:
         """Get current agent status"""
         return {
-            "state": self.state.value,
+            "state": _STATE_NAMES[self.state],
             "findings_count": len(self.findings),
             "sources_count": len(self.sources),
-            "actions_taken": len(self.action_history)
+            "actions_taken": len(self.action_history),
+            "last_action_at": (
+                self._ns_to_iso(self.action_history[-1]["ts_ns"])
+                if self.action_history else None
+            )
         }
 
 
 class MultiTopicResearcher:
     """Research agent that can handle multiple topics"""
     
-    def __init__(self):
-        self.researcher = AgenticResearcher()
+    def __init__(self, max_concurrency: int = 8):
+        self.max_concurrency = max_concurrency
+        self.researchers: dict[str, AgenticResearcher] = {}
     
     async def research_topics(self, topics: list[str], depth: str = "medium") -> dict:
-        """Research multiple topics"""
+        """Research multiple topics concurrently"""
+        
+        # One agent per unique topic so findings/sources don't bleed between
+        # runs; agents are kept across calls so their report caches are reused
+        unique_topics = list(dict.fromkeys(topics))
+        for topic in unique_topics:
+            if topic not in self.researchers:
+                self.researchers[topic] = AgenticResearcher()
+        sem = asyncio.Semaphore(self.max_concurrency)
         
-        results = {}
+        async def _one(topic: str) -> ResearchReport:
+            async with sem:
+                return await self.researchers[topic].research(topic, depth)
         
-        for topic in topics:
-            report = await self.researcher.research(topic, depth)
-            results[topic] = report
+        reports = await asyncio.gather(*(_one(topic) for topic in unique_topics))
         
-        return results
+        return dict(zip(unique_topics, reports))
 
 
 # Demo function
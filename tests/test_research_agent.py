@@ -0,0 +1,576 @@
+import asyncio
+import json
+import sqlite3
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+import research_agent
+from research_agent import (
+    SYNTHESIS_PROMPT,
+    AgenticResearcher,
+    Finding,
+    MultiTopicResearcher,
+    Source,
+)
+
+
+class FlakyResearcher(AgenticResearcher):
+    """Fails extraction for every URL ending in /2"""
+
+    async def _iter_content(self, url, topic):
+        if url.endswith("/2"):
+            raise ConnectionError("boom")
+        async for line in super()._iter_content(url, topic):
+            yield line
+
+
+class CancellingResearcher(AgenticResearcher):
+    """Cancels extraction for every URL ending in /2"""
+
+    async def _iter_content(self, url, topic):
+        if url.endswith("/2"):
+            raise asyncio.CancelledError()
+        async for line in super()._iter_content(url, topic):
+            yield line
+
+
+def test_failing_extraction_is_skipped() -> None:
+    researcher = FlakyResearcher()
+    report = asyncio.run(researcher.research("solar power", depth="medium"))
+
+    assert researcher.get_status()["state"] == "complete"
+    assert len(report.sources) == 5
+    assert len(report.findings) == 3
+    assert all(not f.source.endswith("/2") for f in report.findings)
+    failed = [a for a in researcher.action_history if a["action"] == "extract_failed"]
+    assert len(failed) == 2
+
+
+def test_cancelled_extraction_is_skipped() -> None:
+    researcher = CancellingResearcher()
+    report = asyncio.run(researcher.research("solar power", depth="medium"))
+
+    assert researcher.get_status()["state"] == "complete"
+    assert len(report.findings) == 3
+
+
+def test_research_topics_deduplicates_topics() -> None:
+    multi = MultiTopicResearcher()
+    reports = asyncio.run(multi.research_topics(["a b", "c", "a b"]))
+
+    assert list(reports) == ["a b", "c"]
+    assert list(multi.researchers) == ["a b", "c"]
+    assert all(len(r.findings) == 5 for r in reports.values())
+
+
+def test_cache_hit_and_miss() -> None:
+    researcher = AgenticResearcher()
+
+    async def run():
+        first = await researcher.research("Solar Power")
+        second = await researcher.research("  solar power ")
+        third = await researcher.research("solar power", depth="deep")
+        return first, second, third
+
+    first, second, third = asyncio.run(run())
+
+    stats = researcher.cache_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 2, 2)
+    assert second is not first
+    assert second.summary == first.summary
+    assert len(third.sources) == 10
+
+
+def test_cache_hit_updates_status() -> None:
+    researcher = AgenticResearcher()
+
+    async def run():
+        await researcher.research("solar power", depth="shallow")
+        await researcher.research("wind power", depth="deep")
+        return await researcher.research("solar power", depth="shallow")
+
+    report = asyncio.run(run())
+
+    status = researcher.get_status()
+    assert status["state"] == "complete"
+    assert status["sources_count"] == len(report.sources) == 3
+
+
+def test_cache_entries_expire() -> None:
+    researcher = AgenticResearcher(cache_ttl=0.05)
+
+    async def run():
+        await researcher.research("solar power")
+        await asyncio.sleep(0.1)
+        await researcher.research("solar power")
+
+    asyncio.run(run())
+
+    assert researcher.cache_stats()["hits"] == 0
+    assert researcher.cache_stats()["misses"] == 2
+
+
+def test_semantic_hit_and_single_embedding_per_miss() -> None:
+    calls = []
+
+    def embedder(text):
+        calls.append(text)
+        return [text.count("a"), text.count("e"), 1.0]
+
+    researcher = AgenticResearcher(embedder=embedder)
+
+    async def run():
+        await researcher.research("ai trends")
+        calls.clear()
+        await researcher.research("wind")  # semantic miss
+        assert calls == ["wind"]
+        return await researcher.research("ia trends")  # semantic hit
+
+    report = asyncio.run(run())
+
+    assert report.topic == "ai trends"
+    assert researcher.cache_stats()["hits"] == 1
+
+
+def test_run_without_findings_is_not_cached() -> None:
+    researcher = FlakyResearcher()
+
+    async def run():
+        await researcher.research("solar power", depth="shallow")  # 3 sources, 1 fails
+        return await researcher.research("solar power", depth="shallow")
+
+    asyncio.run(run())
+    assert researcher.cache_stats()["hits"] == 1
+
+    class AllFailing(AgenticResearcher):
+        async def _iter_content(self, url, topic):
+            raise ConnectionError("down")
+            yield  # Makes this an async generator like the original
+
+    failing = AllFailing()
+    report = asyncio.run(failing.research("solar power"))
+
+    assert report.findings == []
+    assert failing.cache_stats()["size"] == 0
+
+
+def test_cache_persists_across_instances(tmp_path) -> None:
+    path = str(tmp_path / "cache.db")
+
+    async def first_run():
+        async with AgenticResearcher(cache_path=path) as researcher:
+            return await researcher.research("solar power")
+
+    async def second_run():
+        async with AgenticResearcher(cache_path=path) as researcher:
+            report = await researcher.research("Solar Power ")
+            return researcher, report
+
+    original = asyncio.run(first_run())
+    researcher, restored = asyncio.run(second_run())
+
+    assert researcher.cache_stats()["hits"] == 1
+    assert researcher._store is None  # closed by aclose()
+    assert isinstance(restored.findings[0], Finding)
+    assert isinstance(restored.sources[0], Source)
+    assert restored.findings == original.findings
+    assert restored.sources == original.sources
+    assert restored.key_insights == original.key_insights
+
+
+def test_unreadable_store_rows_are_dropped(tmp_path) -> None:
+    path = str(tmp_path / "cache.db")
+
+    async def seed():
+        async with AgenticResearcher(cache_path=path) as researcher:
+            await researcher.research("solar power")
+            await researcher.research("wind power")
+
+    asyncio.run(seed())
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "UPDATE reports SET report = ? WHERE topic = ?",
+            (b'{"topic": "x", "summary": "y", "unknown_field": 1}', "solar power")
+        )
+
+    researcher = AgenticResearcher(cache_path=path)
+
+    assert list(researcher._cache) == [("medium", "wind power")]
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM reports").fetchone()[0] == 1
+    asyncio.run(researcher.aclose())
+
+
+def test_fetch_pages_requires_httpx(monkeypatch) -> None:
+    monkeypatch.setattr(research_agent, "httpx", None)
+
+    with pytest.raises(ImportError, match="httpx"):
+        AgenticResearcher(fetch_pages=True)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_to_json(monkeypatch, use_orjson) -> None:
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(research_agent, "orjson", None)
+
+    report = asyncio.run(AgenticResearcher().research("café • trends"))
+    data = json.loads(report.to_json())
+
+    assert data["topic"] == "café • trends"
+    assert data["findings"][0]["key_points"] == report.findings[0].key_points
+    assert data["sources"][0]["url"] == report.sources[0].url
+    assert research_agent._report_from_dict(data) == report
+
+    with pytest.raises(TypeError):
+        research_agent._dumps({"when": object()})
+
+
+def test_to_json_matches_with_and_without_orjson(monkeypatch) -> None:
+    pytest.importorskip("orjson")
+    report = asyncio.run(AgenticResearcher().research("café • trends"))
+
+    fast = report.to_json()
+    monkeypatch.setattr(research_agent, "orjson", None)
+
+    assert report.to_json() == fast
+
+
+def test_extract_content_and_points_single_pass() -> None:
+    consumed = []
+
+    async def lines():
+        for line in ["intro", "- 10 apples", "  2. two", "-", "* x", "3. y", "- z", "tail"]:
+            consumed.append(line)
+            yield line
+
+    async def run():
+        return await AgenticResearcher()._extract_content_and_points(lines(), max_chars=10)
+
+    content, points = asyncio.run(run())
+
+    assert content == "intro\n- 10"
+    assert points == ["10 apples", "two", "x", "y", "z"]
+    assert "tail" not in consumed
+
+
+def test_research_topics_reuses_agents_across_calls() -> None:
+    multi = MultiTopicResearcher()
+
+    async def run():
+        await multi.research_topics(["a b", "c"])
+        agent = multi.researchers["a b"]
+        await multi.research_topics(["a b", "d"])
+        return agent
+
+    agent = asyncio.run(run())
+
+    assert multi.researchers["a b"] is agent
+    assert agent.cache_stats()["hits"] == 1
+    assert list(multi.researchers) == ["a b", "c", "d"]
+
+
+def test_embedder_failure_returns_error_report() -> None:
+    calls = []
+
+    def embedder(text):
+        calls.append(text)
+        if len(calls) > 1:
+            raise RuntimeError("embedder down")
+        return [1.0, 0.0]
+
+    researcher = AgenticResearcher(embedder=embedder)
+
+    async def run():
+        await researcher.research("solar power")
+        return await researcher.research("wind power")
+
+    report = asyncio.run(run())
+
+    assert report.summary == "Error: embedder down"
+    assert researcher.get_status()["state"] == "error"
+
+
+def test_cache_key_collapses_whitespace() -> None:
+    researcher = AgenticResearcher()
+
+    async def run():
+        await researcher.research("solar power")
+        await researcher.research("Solar   power")
+
+    asyncio.run(run())
+
+    assert researcher.cache_stats()["hits"] == 1
+    assert researcher.cache_stats()["misses"] == 1
+
+
+class RecordingLLM:
+    def __init__(self):
+        self.calls = []
+
+    async def generate(self, prompt, **kwargs):
+        self.calls.append((prompt, kwargs))
+        return "summary"
+
+
+class CachingLLM(RecordingLLM):
+    supports_prompt_caching = True
+
+
+def test_synthesis_prompt_layout_and_cache_prefix() -> None:
+    llm = CachingLLM()
+    report = asyncio.run(AgenticResearcher(llm_provider=llm).research("solar power"))
+
+    assert report.summary == "summary"
+    (prompt, kwargs), = llm.calls
+    assert prompt.startswith(f"{SYNTHESIS_PROMPT}\nTopic: solar power\n")
+    assert prompt.startswith(kwargs["cache_prefix"])
+    assert report.findings[0].content in prompt[len(kwargs["cache_prefix"]):]
+
+
+def test_synthesis_without_prompt_caching_support() -> None:
+    llm = RecordingLLM()
+    asyncio.run(AgenticResearcher(llm_provider=llm).research("solar power"))
+
+    (prompt, kwargs), = llm.calls
+    assert prompt.startswith(f"{SYNTHESIS_PROMPT}\nTopic: solar power\n")
+    assert kwargs == {}
+
+
+def _finding(content):
+    return Finding(topic="t", content=content, source="https://example.com")
+
+
+def test_relevance_matches_whole_words() -> None:
+    findings = [_finding("the cat sat"), _finding("concatenate the categories")]
+    asyncio.run(AgenticResearcher()._analyze_findings("cat", findings))
+
+    assert [f.confidence for f in findings] == [1.0, 0.0]
+    assert findings[0].content == "the cat sat"
+
+
+def test_relevance_with_empty_topic() -> None:
+    findings = [_finding("anything at all")]
+    asyncio.run(AgenticResearcher()._analyze_findings("", findings))
+
+    assert findings[0].confidence == 0.0
+
+
+@pytest.mark.parametrize(
+    "depth, num_queries, num_sources",
+    [("shallow", 2, 3), ("medium", 3, 5), ("deep", 5, 10)],
+)
+def test_queries_per_depth(depth, num_queries, num_sources) -> None:
+    researcher = AgenticResearcher()
+    report = asyncio.run(researcher.research("Solar   Power", depth=depth))
+
+    searches = [a["params"]["query"] for a in researcher.action_history if a["action"] == "searching"]
+    assert len(searches) == num_queries
+    assert len(report.sources) == num_sources
+    assert searches[:2] == ["solar power", "what is solar power"]
+
+
+def test_generate_search_queries_normalizes_whitespace() -> None:
+    queries = AgenticResearcher()._generate_search_queries("  Solar \t Power ", 5)
+
+    assert queries[0] == "solar power"
+    assert len(queries) == len(set(queries)) == 5
+
+
+def test_formatted_history_and_last_action_at() -> None:
+    researcher = AgenticResearcher()
+    assert researcher.get_status()["last_action_at"] is None
+
+    before = datetime.now()
+    asyncio.run(researcher.research("solar power"))
+    after = datetime.now()
+
+    history = researcher.formatted_history()
+    assert [e["action"] for e in history] == [e["action"] for e in researcher.action_history]
+    assert all("ts_ns" not in e for e in history)
+    stamps = [datetime.fromisoformat(e["timestamp"]) for e in history]
+    assert stamps == sorted(stamps)
+    assert before - timedelta(seconds=1) <= stamps[0] <= stamps[-1] <= after + timedelta(seconds=1)
+    assert researcher.get_status()["last_action_at"] == history[-1]["timestamp"]
+
+
+def test_ns_to_iso_is_anchored_to_wall_clock() -> None:
+    researcher = AgenticResearcher()
+    base = datetime.fromtimestamp(researcher._wall_base)
+
+    start = datetime.fromisoformat(researcher._ns_to_iso(researcher._mono_base))
+    later = datetime.fromisoformat(researcher._ns_to_iso(researcher._mono_base + 2_500_000_000))
+
+    assert abs(start - base) <= timedelta(microseconds=1)
+    assert abs(later - base - timedelta(seconds=2.5)) <= timedelta(microseconds=1)
+
+
+def test_findings_do_not_accumulate_across_runs() -> None:
+    researcher = AgenticResearcher()
+
+    async def run():
+        first = await researcher.research("solar power")
+        first_findings = list(first.findings)
+        first_sources = list(first.sources)
+        second = await researcher.research("wind power")
+        return first, first_findings, first_sources, second
+
+    first, first_findings, first_sources, second = asyncio.run(run())
+
+    assert len(second.findings) == 5
+    assert all(f.topic == "wind power" for f in second.findings)
+    assert all("wind-power" in s.url for s in second.sources)
+    assert first.findings == first_findings
+    assert first.sources == first_sources
+    assert researcher.get_status()["findings_count"] == 5
+
+
+def test_locked_store_falls_back_to_memory(tmp_path) -> None:
+    path = str(tmp_path / "cache.db")
+    researcher = AgenticResearcher(cache_path=path)
+    researcher._store.execute("PRAGMA busy_timeout = 0")
+
+    other = sqlite3.connect(path)
+    other.execute("BEGIN EXCLUSIVE")
+    try:
+        report = asyncio.run(researcher.research("solar power"))
+    finally:
+        other.rollback()
+        other.close()
+
+    assert len(report.findings) == 5
+    assert researcher.get_status()["state"] == "complete"
+    failures = [a["params"]["op"] for a in researcher.action_history if a["action"] == "cache_store_failed"]
+    assert failures == ["read", "write"]
+
+    again = asyncio.run(researcher.research("solar power"))
+    assert researcher.cache_stats()["hits"] == 1
+    assert again.findings == report.findings
+    asyncio.run(researcher.aclose())
+
+
+def test_embedder_with_non_float_values_persists(tmp_path) -> None:
+    path = str(tmp_path / "cache.db")
+
+    def embedder(text):
+        return [Decimal(text.count("a")), Decimal(text.count("e")), Decimal(1)]
+
+    async def run():
+        async with AgenticResearcher(embedder=embedder, cache_path=path) as researcher:
+            await researcher.research("ai trends")
+            await researcher.research("wind")
+        async with AgenticResearcher(embedder=embedder, cache_path=path) as researcher:
+            report = await researcher.research("ia trends")
+            return researcher, report
+
+    researcher, report = asyncio.run(run())
+
+    assert report.topic == "ai trends"
+    assert researcher.cache_stats()["hits"] == 1
+    assert all(type(x) is float for v in researcher._cache_vectors.values() for x in v)
+
+
+def test_fetch_pages_uses_one_pooled_client(monkeypatch) -> None:
+    httpx = pytest.importorskip("httpx")
+    real_client = httpx.AsyncClient
+    clients = []
+    requested = []
+
+    def handler(request):
+        requested.append(str(request.url))
+        if request.url.path.endswith("/2"):
+            return httpx.Response(503)
+        return httpx.Response(200, text="Fetched page\n- live point\n1. another")
+
+    def make_client(**kwargs):
+        client = real_client(transport=httpx.MockTransport(handler), **kwargs)
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(research_agent.httpx, "AsyncClient", make_client)
+
+    async def run():
+        async with AgenticResearcher(fetch_pages=True) as researcher:
+            report = await researcher.research("solar power")
+            return researcher, report
+
+    researcher, report = asyncio.run(run())
+
+    assert len(clients) == 1
+    assert len(requested) == 5
+    assert len(report.findings) == 3
+    assert report.findings[0].key_points == ["live point", "another"]
+    failed = [a["params"]["url"] for a in researcher.action_history if a["action"] == "extract_failed"]
+    assert len(failed) == 2 and all(url.endswith("/2") for url in failed)
+    assert clients[0].is_closed
+    assert researcher._http is None
+
+
+def test_state_names_are_unchanged() -> None:
+    researcher = AgenticResearcher()
+    assert researcher.get_status()["state"] == "idle"
+
+    asyncio.run(researcher.research("solar power"))
+
+    assert researcher.get_status()["state"] == "complete"
+    assert [a["state"] for a in researcher.action_history][:2] == ["searching", "searching"]
+    assert {a["state"] for a in researcher.action_history} == {
+        "searching", "extracting", "complete"
+    }
+
+
+def test_search_queries_are_memoized() -> None:
+    research_agent._queries_for.cache_clear()
+    researcher = AgenticResearcher()
+
+    first = researcher._generate_search_queries("Solar Power", 3)
+    second = researcher._generate_search_queries("solar   power", 3)
+
+    assert second is first
+    assert isinstance(first, tuple)
+    info = research_agent._queries_for.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_history_json(monkeypatch, use_orjson) -> None:
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(research_agent, "orjson", None)
+
+    researcher = AgenticResearcher()
+    asyncio.run(researcher.research("solar power"))
+
+    assert json.loads(researcher.history_json()) == researcher.formatted_history()
+
+
+def test_dumps_matches_orjson_for_datetimes(monkeypatch) -> None:
+    pytest.importorskip("orjson")
+    value = {
+        "naive": datetime(2026, 10, 15, 1, 2, 3, 456789),
+        "whole": datetime(2026, 10, 15, 1, 2, 3),
+        "aware": datetime(2026, 10, 15, 1, 2, 3, tzinfo=timezone.utc),
+        "day": date(2026, 10, 15),
+    }
+
+    fast = research_agent._dumps(value)
+    monkeypatch.setattr(research_agent, "orjson", None)
+
+    assert research_agent._dumps(value) == fast
+
+
+def test_marker_only_lines_are_not_key_points() -> None:
+    async def lines():
+        for line in ["-   ", "*\t", "1.  ", "- real point  "]:
+            yield line
+
+    async def run():
+        return await AgenticResearcher()._extract_content_and_points(lines())
+
+    _, points = asyncio.run(run())
+
+    assert points == ["real point"]